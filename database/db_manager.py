@@ -1,136 +1,744 @@
 import os
 import json
+import queue
+import logging
+import atexit
 import sqlite3
-from datetime import datetime
-from typing import Dict, Any, Optional, List
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from datetime import datetime, timedelta
+from typing import Dict, Any, Optional, List, Iterator, Tuple, IO
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson is several times faster than the json module on both sides; its
+# JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+if orjson is not None:
+    def _json_dumps(obj: Any) -> str:
+        """Serialize obj to a JSON string."""
+        return orjson.dumps(obj).decode()
+
+    _json_loads = orjson.loads
+else:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+@lru_cache(maxsize=None)
+def _sqlite_has_json1() -> bool:
+    """Check once whether the SQLite library provides the JSON1 functions."""
+    # sqlite_compileoption_used('ENABLE_JSON1') reports 0 on SQLite 3.38+,
+    # where JSON is built in, so probe for the functions directly
+    conn = sqlite3.connect(":memory:")
+    try:
+        conn.execute("SELECT json('[]')")
+        return True
+    except sqlite3.OperationalError:
+        return False
+    finally:
+        conn.close()
+
+@lru_cache(maxsize=1024)
+def _parse_json_array(json_array: str) -> frozenset:
+    """
+    Decode a JSON array into a set of its scalar items.
+
+    Memoized on the JSON text, so rows sharing the same tags string (and
+    the one-check-per-tag calls on each row) decode it only once.
+    """
+    try:
+        array = _json_loads(json_array)
+    except json.JSONDecodeError:
+        return frozenset()
+    if not isinstance(array, list):
+        return frozenset()
+    return frozenset(
+        item for item in array if isinstance(item, (str, int, float))
+    )
+
+# Backslash-escapes the LIKE wildcards, for use with ESCAPE '\'
+_LIKE_ESCAPES = str.maketrans({'\\': '\\\\', '%': '\\%', '_': '\\_'})
+
+def _json_array_contains(json_array: str, value: str) -> bool:
+    """SQLite function to check if a JSON array contains a value."""
+    if not json_array:
+        return False
+    return value in _parse_json_array(json_array)
+
+logger = logging.getLogger(__name__)
+
+class _ConnectionPool:
+    """
+    Long-lived connections to one database file: a single write connection
+    plus a lazily filled pool of read connections. Shared by every
+    DatabaseManager that uses the file.
+    """
+    # Applied to every connection; journal_mode is set once in __init__
+    PRAGMAS = (
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA mmap_size=268435456",
+        "PRAGMA cache_size=-64000",
+        "PRAGMA foreign_keys=ON",
+    )
+
+    # Per-connection prepared statement cache size (sqlite3 default is 128)
+    STATEMENT_CACHE_SIZE = 256
+
+    def __init__(self, db_path: str, read_pool_size: int):
+        self.db_path = db_path
+        self.read_pool_size = read_pool_size
+        self.has_json1 = _sqlite_has_json1()
+        self._write_conn = self._connect()
+        self._write_lock = threading.RLock()
+        self._read_queue: "queue.Queue[sqlite3.Connection]" = queue.Queue()
+        self._read_conns: List[sqlite3.Connection] = []
+        self._read_lock = threading.Lock()
+        self._read_local = threading.local()
+
+        # WAL lets pooled readers run alongside the writer. The setting is
+        # persistent, and SQLite keeps .db-wal / .db-shm files next to the
+        # database while it is open.
+        self._write_conn.execute("PRAGMA journal_mode=WAL")
+        self.has_fts5 = bool(self._write_conn.execute(
+            "SELECT sqlite_compileoption_used('ENABLE_FTS5')"
+        ).fetchone()[0])
+        atexit.register(self.close)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a long-lived connection for the pool."""
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=self.STATEMENT_CACHE_SIZE
+        )
+        conn.row_factory = sqlite3.Row
+        for pragma in self.PRAGMAS:
+            conn.execute(pragma)
+        # The Python UDF is only needed when the JSON1 functions are missing
+        if not self.has_json1:
+            conn.create_function("json_array_contains", 2, _json_array_contains)
+        return conn
+
+    @contextmanager
+    def write(self) -> Iterator[sqlite3.Connection]:
+        """Borrow the single write connection (re-entrant within a thread)."""
+        with self._write_lock:
+            yield self._write_conn
+
+    @contextmanager
+    def read(self) -> Iterator[sqlite3.Connection]:
+        """
+        Borrow a read connection, opening one if the pool is not full yet.
+
+        Nested calls in the same thread share the outer connection, so a
+        caller can group several reads into one snapshot. The connection is
+        reference counted and goes back to the pool when the last borrow
+        ends, whichever order the borrows end in (generators over the
+        iter_* methods can be closed in any order).
+        """
+        local = self._read_local
+        if not getattr(local, 'count', 0):
+            local.conn = self._acquire_read()
+            local.count = 0
+        local.count += 1
+        conn = local.conn
+        try:
+            yield conn
+        finally:
+            local.count -= 1
+            if not local.count:
+                local.conn = None
+                self._read_queue.put(conn)
+
+    def _acquire_read(self) -> sqlite3.Connection:
+        """Take an idle read connection, opening one if the pool is not full."""
+        try:
+            return self._read_queue.get_nowait()
+        except queue.Empty:
+            pass
+        with self._read_lock:
+            if len(self._read_conns) < self.read_pool_size:
+                conn = self._connect()
+                self._read_conns.append(conn)
+                return conn
+        return self._read_queue.get()
+
+    def close(self):
+        """Close all pooled connections."""
+        atexit.unregister(self.close)
+        with self._write_lock:
+            self._write_conn.close()
+        with self._read_lock:
+            for conn in self._read_conns:
+                conn.close()
+            self._read_conns.clear()
 
 class DatabaseManager:
-    def __init__(self, client_id: str):
-        """Initialize database manager for a specific client."""
+    # File shared by all clients; every row carries the owning client_id
+    DB_FILENAME = "all.db"
+
+    # Connection pools shared by all managers, keyed by database path
+    _pools: Dict[str, _ConnectionPool] = {}
+    _pools_lock = threading.Lock()
+
+    _SQL_CREATE_INDEXES = (
+        "CREATE INDEX IF NOT EXISTS idx_solutions_lead_status "
+        "ON tailored_solutions (lead_id, status)",
+        "CREATE INDEX IF NOT EXISTS idx_solutions_lead_generated "
+        "ON tailored_solutions (lead_id, generated_at DESC)",
+        "CREATE INDEX IF NOT EXISTS idx_solutions_client_generated "
+        "ON tailored_solutions (client_id, generated_at DESC)",
+        "CREATE INDEX IF NOT EXISTS idx_outreach_lead_sent "
+        "ON outreach_log (lead_id, sent_at DESC)",
+        "CREATE INDEX IF NOT EXISTS idx_outreach_client_sent "
+        "ON outreach_log (client_id, sent_at DESC)",
+        "CREATE INDEX IF NOT EXISTS idx_industry_client_created "
+        "ON industry_data (client_id, created_at DESC)",
+        "CREATE INDEX IF NOT EXISTS idx_industry_client_source "
+        "ON industry_data (client_id, source, crawled_at DESC)",
+        "CREATE INDEX IF NOT EXISTS idx_leads_client_created "
+        "ON lead_bucket (client_id, created_at DESC)",
+        # Partial index so get_pending_responses only walks unanswered rows
+        "CREATE INDEX IF NOT EXISTS idx_outreach_pending "
+        "ON outreach_log (client_id, sent_at DESC) WHERE response IS NULL",
+    )
+
+    # Hot statements are kept as class constants so every call passes the same
+    # SQL text and hits the connection's prepared statement cache.
+    _SQL_INSERT_CLIENT = """
+        INSERT INTO clients
+        (client_id, telegram_handle, email, industry, location, campaign_parameters)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """
+    _SQL_GET_CLIENT = """
+        SELECT * FROM clients WHERE client_id = ? AND telegram_handle = ?
+    """
+    _SQL_INSERT_INDUSTRY_DATA = """
+        INSERT INTO industry_data
+        (client_id, source, title, content, pain_points, tags, crawled_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """
+    _SQL_INSERT_LEAD = """
+        INSERT INTO lead_bucket
+        (client_id, company_name, website, contact_info, details)
+        VALUES (?, ?, ?, ?, ?)
+    """
+    _SQL_INSERT_SOLUTION = """
+        INSERT INTO tailored_solutions (client_id, lead_id, solution_text)
+        VALUES (?, ?, ?)
+    """
+    _SQL_INSERT_OUTREACH = """
+        INSERT INTO outreach_log (client_id, lead_id, message_sent)
+        VALUES (?, ?, ?)
+    """
+    # Matches the client's rows sharing any tag with the JSON array bound to
+    # the second parameter, served from the industry_tags primary key
+    _SQL_TAG_FILTER = """industry_data.id IN (
+        SELECT industry_id FROM industry_tags
+        WHERE client_id = ? AND tag IN (SELECT value FROM json_each(?))
+    )"""
+    _SQL_CAMPAIGN_STATS = """
+        WITH lead_totals AS (
+            SELECT COUNT(*) AS total FROM lead_bucket WHERE client_id = ?1
+        ), outreach_totals AS (
+            SELECT
+                COUNT(*) AS total,
+                SUM(CASE WHEN response IS NOT NULL THEN 1 ELSE 0 END) AS responses
+            FROM outreach_log
+            WHERE client_id = ?1
+        )
+        SELECT 'totals' AS kind, NULL AS status, NULL AS count,
+               lead_totals.total AS total_leads,
+               outreach_totals.total AS total_outreach,
+               outreach_totals.responses AS responses
+        FROM lead_totals, outreach_totals
+        UNION ALL
+        SELECT 'solution', status, COUNT(*), NULL, NULL, NULL
+        FROM tailored_solutions
+        WHERE client_id = ?1
+        GROUP BY status
+    """
+
+    def __init__(self, client_id: str, read_pool_size: Optional[int] = None):
+        """
+        Initialize database manager for a specific client.
+
+        Args:
+            client_id: Identifier of the client whose rows are accessed
+            read_pool_size: Maximum number of pooled read connections
+                (defaults to the number of CPUs). Only used by the manager
+                that first opens the shared database.
+        """
         self.client_id = client_id
         self.db_path = self._get_db_path()
+        self._read_pool_size = read_pool_size or os.cpu_count() or 1
+        # Decoded client rows keyed by telegram_handle, see get_client
+        self._client_cache: Dict[str, Dict[str, Any]] = {}
         self._init_database()
 
     def _get_db_path(self) -> str:
-        """Get the database path for the client."""
+        """Get the path of the database shared by all clients."""
         db_dir = os.path.join(os.path.dirname(__file__), "client_dbs")
         os.makedirs(db_dir, exist_ok=True)
-        return os.path.join(db_dir, f"{self.client_id}.db")
+        return os.path.join(db_dir, self.DB_FILENAME)
 
-    def _json_array_contains(self, json_array: str, value: str) -> bool:
-        """SQLite function to check if a JSON array contains a value."""
-        if not json_array:
-            return False
+    @property
+    def _pool(self) -> _ConnectionPool:
+        """The shared connection pool for this database, reopened if closed."""
+        pool = self._pools.get(self.db_path)
+        return pool if pool is not None else self._init_database()
+
+    def _tag_filter(self, tags: List[str]) -> Tuple[str, List[Any]]:
+        """Build a WHERE condition matching rows tagged with any of the tags."""
+        if self._pool.has_json1:
+            return self._SQL_TAG_FILTER, [self.client_id, _json_dumps(tags)]
+        # Fall back to the Python UDF when JSON1 is not available
+        return self._udf_tag_filter_sql(len(tags)), list(tags)
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _udf_tag_filter_sql(tag_count: int) -> str:
+        """OR-chain of json_array_contains() checks for tag_count tags."""
+        tag_conditions = ' OR '.join(
+            "json_array_contains(industry_data.tags, ?)" for _ in range(tag_count)
+        )
+        return f"({tag_conditions})"
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _update_lead_sql(fields: Tuple[str, ...]) -> str:
+        """UPDATE statement setting the given lead_bucket fields, in order."""
+        set_clause = ", ".join(f"{field} = ?" for field in fields)
+        return f"UPDATE lead_bucket SET {set_clause} WHERE id = ? AND client_id = ?"
+
+    @contextmanager
+    def _write(self) -> Iterator[sqlite3.Connection]:
+        """Borrow the shared write connection."""
+        with self._pool.write() as conn:
+            yield conn
+
+    @contextmanager
+    def _read(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a shared read connection."""
+        with self._pool.read() as conn:
+            yield conn
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Group several writes into one atomic transaction.
+
+        The write lock is held for the whole block, so the regular add_* and
+        update_* methods can be called inside it and commit together. Nested
+        transaction() blocks, including the one the *_bulk methods open,
+        join the outer transaction through a savepoint.
+
+        Reads made inside the block go through the read pool and do not see
+        its uncommitted writes.
+        """
+        with self._write() as conn:
+            if conn.in_transaction:
+                # Only this thread can be inside the outer transaction, since
+                # it holds the write lock
+                conn.execute("SAVEPOINT nested_transaction")
+                try:
+                    yield conn
+                except BaseException:
+                    conn.execute("ROLLBACK TO nested_transaction")
+                    conn.execute("RELEASE nested_transaction")
+                    raise
+                conn.execute("RELEASE nested_transaction")
+                return
+
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def close(self):
+        """
+        Close the shared connection pool for this database. Managers that are
+        still in use reopen it on their next call.
+        """
+        with self._pools_lock:
+            pool = self._pools.pop(self.db_path, None)
+        if pool is not None:
+            pool.close()
+
+    def _init_database(self) -> _ConnectionPool:
+        """
+        Open the shared connection pool for this database, creating all
+        required tables the first time it is opened in this process.
+        """
+        with self._pools_lock:
+            pool = self._pools.get(self.db_path)
+            if pool is None:
+                pool = _ConnectionPool(self.db_path, self._read_pool_size)
+                with pool.write() as conn:
+                    self._create_tables(conn, pool)
+                    self._import_legacy_databases(conn)
+                self._pools[self.db_path] = pool
+            return pool
+
+    # Tables copied from legacy per-client files, parents before children
+    _LEGACY_TABLES = ("clients", "industry_data", "lead_bucket",
+                      "tailored_solutions", "outreach_log")
+
+    def _import_legacy_databases(self, conn: sqlite3.Connection):
+        """
+        Import the per-client client_dbs/<client_id>.db files used before the
+        shared database, tagging every row with the file's client_id.
+
+        Each file is imported in one transaction and then renamed to
+        <client_id>.db.imported, so it is only imported once and stays
+        available as a backup. A file that fails to import is logged and left
+        in place, without affecting the shared database.
+        """
+        db_dir = os.path.dirname(self.db_path)
+        for filename in sorted(os.listdir(db_dir)):
+            if not filename.endswith(".db") or filename == self.DB_FILENAME:
+                continue
+            legacy_path = os.path.join(db_dir, filename)
+            try:
+                self._import_legacy_database(conn, legacy_path, filename[:-len(".db")])
+            except sqlite3.Error as e:
+                logger.warning("Could not import legacy database %s: %s", legacy_path, e)
+                continue
+            for suffix in ("", "-wal", "-shm"):
+                if os.path.exists(legacy_path + suffix):
+                    os.replace(legacy_path + suffix, legacy_path + ".imported" + suffix)
+
+    def _import_legacy_database(self, conn: sqlite3.Connection, legacy_path: str, client_id: str):
+        """Copy one legacy database into the shared tables in one transaction."""
+        conn.execute("ATTACH DATABASE ? AS legacy", (legacy_path,))
         try:
-            array = json.loads(json_array)
-            return value in array if isinstance(array, list) else False
-        except json.JSONDecodeError:
-            return False
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._copy_legacy_rows(conn, client_id)
+                conn.execute("COMMIT")
+            except BaseException:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                raise
+        finally:
+            conn.execute("DETACH DATABASE legacy")
 
-    def _init_database(self):
-        """Initialize the database with all required tables."""
-        with sqlite3.connect(self.db_path) as conn:
-            # Register JSON array contains function
-            conn.create_function("json_array_contains", 2, self._json_array_contains)
+    def _copy_legacy_rows(self, conn: sqlite3.Connection, client_id: str):
+        """Copy the rows of the attached legacy database into the shared tables."""
+        legacy_tables = {row[0] for row in conn.execute(
+            "SELECT name FROM legacy.sqlite_master WHERE type = 'table'"
+        )}
 
-            # Create clients table
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS clients (
-                    telegram_handle TEXT PRIMARY KEY,
-                    email TEXT,
-                    industry TEXT,
-                    location TEXT,
-                    campaign_parameters TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
+        # Legacy lead ids are shifted past the existing ones, and the child
+        # rows' lead_id with them, so the references stay intact
+        lead_offset = conn.execute(
+            "SELECT COALESCE(MAX(id), 0) FROM main.lead_bucket"
+        ).fetchone()[0]
 
-            # Create industry_data table with new fields for title, tags, and crawl timestamp
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS industry_data (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    source TEXT,
-                    title TEXT,
-                    content TEXT,
-                    pain_points TEXT,
-                    tags TEXT,  -- JSON array of tags
-                    crawled_at TEXT,  -- ISO format timestamp
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
+        for table in self._LEGACY_TABLES:
+            if table not in legacy_tables:
+                continue
+            main_columns = [row[1] for row in conn.execute(f"PRAGMA main.table_info({table})")]
+            legacy_columns = {row[1] for row in conn.execute(f"PRAGMA legacy.table_info({table})")}
+            # Row ids are reassigned, except lead ids which are shifted
+            columns = [c for c in main_columns
+                       if c in legacy_columns and c not in ('id', 'client_id', 'lead_id')]
+            select = [f"l.{c}" for c in columns]
+            if table == "industry_data" and "tags" in columns and _sqlite_has_json1():
+                # The old readers treated unparsable tags as no tags
+                select[columns.index("tags")] = "CASE WHEN json_valid(l.tags) THEN l.tags END"
+            condition = ""
 
-            # Create lead_bucket table
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS lead_bucket (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    company_name TEXT,
-                    website TEXT,
-                    contact_info TEXT,
-                    details TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
+            if table == "lead_bucket":
+                columns.insert(0, "id")
+                select.insert(0, "l.id + ?")
+            elif 'lead_id' in legacy_columns:
+                # Skip rows pointing at leads the legacy file does not have
+                columns.append("lead_id")
+                select.append("l.lead_id + ?")
+                condition = " WHERE l.lead_id IN (SELECT id FROM legacy.lead_bucket)"
+            params = [client_id]
+            if table == "lead_bucket" or 'lead_id' in columns:
+                params.append(lead_offset)
 
-            # Create tailored_solutions table
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS tailored_solutions (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    lead_id INTEGER,
-                    solution_text TEXT,
-                    generated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    status TEXT DEFAULT 'pending',
-                    FOREIGN KEY (lead_id) REFERENCES lead_bucket (id)
-                )
-            """)
+            # Legacy clients whose handle is already present are kept as is
+            insert = "INSERT OR IGNORE" if table == "clients" else "INSERT"
+            conn.execute(
+                f"{insert} INTO main.{table} (client_id, {', '.join(columns)}) "
+                f"SELECT ?, {', '.join(select)} FROM legacy.{table} l{condition}",
+                params
+            )
+
+    def _create_tables(self, conn: sqlite3.Connection, pool: _ConnectionPool):
+        """Create all tables, indexes and triggers if they do not exist."""
+        # Create clients table
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS clients (
+                client_id TEXT NOT NULL,
+                telegram_handle TEXT NOT NULL,
+                email TEXT,
+                industry TEXT,
+                location TEXT,
+                campaign_parameters TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (client_id, telegram_handle)
+            )
+        """)
+
+        # Create industry_data table with new fields for title, tags, and crawl timestamp
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS industry_data (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                client_id TEXT NOT NULL,
+                source TEXT,
+                title TEXT,
+                content TEXT,
+                pain_points TEXT,
+                tags TEXT,  -- JSON array of tags
+                crawled_at TEXT,  -- ISO format timestamp
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+
+        if pool.has_json1:
+            self._create_industry_tags(conn)
+        if pool.has_fts5:
+            self._create_industry_fts(conn)
+
+        # Create pain_point_cache table; keyed by a hash of the analysed
+        # content, so entries are shared between clients
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS pain_point_cache (
+                content_hash TEXT PRIMARY KEY,
+                pain_points TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            ) WITHOUT ROWID
+        """)
+
+        # Create lead_bucket table; (client_id, id) is the target of the
+        # compound foreign keys below so child rows cannot cross clients
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS lead_bucket (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                client_id TEXT NOT NULL,
+                company_name TEXT,
+                website TEXT,
+                contact_info TEXT,
+                details TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                UNIQUE (client_id, id)
+            )
+        """)
+
+        # Create tailored_solutions table
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS tailored_solutions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                client_id TEXT NOT NULL,
+                lead_id INTEGER,
+                solution_text TEXT,
+                generated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                status TEXT DEFAULT 'pending',
+                FOREIGN KEY (client_id, lead_id) REFERENCES lead_bucket (client_id, id)
+            )
+        """)
+
+        # Create outreach_log table
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS outreach_log (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                client_id TEXT NOT NULL,
+                lead_id INTEGER,
+                message_sent TEXT,
+                sent_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                response TEXT,
+                updated_at TIMESTAMP,
+                FOREIGN KEY (client_id, lead_id) REFERENCES lead_bucket (client_id, id)
+            )
+        """)
+
+        # Create indexes for foreign key joins and "most recent" queries
+        for statement in self._SQL_CREATE_INDEXES:
+            conn.execute(statement)
+
+        # Refresh planner statistics, sampling a bounded number of rows
+        # per index so startup stays cheap on large databases
+        conn.execute("PRAGMA analysis_limit=1000")
+        conn.execute("ANALYZE")
+
+    def _insert_many(self, sql: str, rows: List[tuple]) -> List[int]:
+        """Insert rows with executemany in one transaction and return their ids."""
+        if not rows:
+            return []
+        with self.transaction() as conn:
+            conn.executemany(sql, rows)
+            last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+        # The write lock is held for the whole transaction, so AUTOINCREMENT
+        # hands out consecutive ids to the rows of this batch
+        return list(range(last_id - len(rows) + 1, last_id + 1))
+
+    def _create_industry_tags(self, conn: sqlite3.Connection):
+        """
+        Create the industry_tags lookup table and the triggers that keep it in
+        sync with industry_data.tags, backfilling rows that predate it.
+        """
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'industry_tags'"
+        ).fetchone()
+
+        # One row per (client, tag, entry) so tag filters are an index range scan
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS industry_tags (
+                client_id TEXT NOT NULL,
+                tag TEXT NOT NULL,
+                industry_id INTEGER NOT NULL,
+                PRIMARY KEY (client_id, tag, industry_id)
+            ) WITHOUT ROWID
+        """)
+
+        # Rows whose tags are not valid JSON are stored without tag rows,
+        # like the backfill below; replace triggers created before the check
+        for trigger in ("industry_tags_insert", "industry_tags_update"):
+            row = conn.execute(
+                "SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = ?",
+                (trigger,)
+            ).fetchone()
+            if row and "json_valid" not in row[0]:
+                conn.execute(f"DROP TRIGGER {trigger}")
 
-            # Create outreach_log table
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS industry_tags_insert
+            AFTER INSERT ON industry_data
+            BEGIN
+                INSERT OR IGNORE INTO industry_tags (client_id, tag, industry_id)
+                SELECT NEW.client_id, value, NEW.id FROM json_each(NEW.tags)
+                WHERE json_valid(NEW.tags);
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS industry_tags_update
+            AFTER UPDATE OF tags ON industry_data
+            BEGIN
+                DELETE FROM industry_tags
+                WHERE client_id = OLD.client_id AND industry_id = OLD.id;
+                INSERT OR IGNORE INTO industry_tags (client_id, tag, industry_id)
+                SELECT NEW.client_id, value, NEW.id FROM json_each(NEW.tags)
+                WHERE json_valid(NEW.tags);
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS industry_tags_delete
+            AFTER DELETE ON industry_data
+            BEGIN
+                DELETE FROM industry_tags
+                WHERE client_id = OLD.client_id AND industry_id = OLD.id;
+            END
+        """)
+
+        if not exists:
             conn.execute("""
-                CREATE TABLE IF NOT EXISTS outreach_log (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    lead_id INTEGER,
-                    message_sent TEXT,
-                    sent_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    response TEXT,
-                    updated_at TIMESTAMP,
-                    FOREIGN KEY (lead_id) REFERENCES lead_bucket (id)
-                )
+                INSERT OR IGNORE INTO industry_tags (client_id, tag, industry_id)
+                SELECT d.client_id, j.value, d.id
+                FROM industry_data d, json_each(d.tags) j
+                WHERE json_valid(d.tags)
             """)
 
-    def create_client(self, telegram_handle: str, email: str, industry: str, 
+    def _create_industry_fts(self, conn: sqlite3.Connection):
+        """
+        Create the industry_fts full-text index over industry_data titles and
+        content, with triggers keeping the external-content table in sync.
+        """
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'industry_fts'"
+        ).fetchone()
+
+        conn.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS industry_fts USING fts5(
+                title, content,
+                content='industry_data', content_rowid='id',
+                tokenize='porter unicode61'
+            )
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS industry_fts_insert
+            AFTER INSERT ON industry_data
+            BEGIN
+                INSERT INTO industry_fts (rowid, title, content)
+                VALUES (NEW.id, NEW.title, NEW.content);
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS industry_fts_update
+            AFTER UPDATE OF title, content ON industry_data
+            BEGIN
+                INSERT INTO industry_fts (industry_fts, rowid, title, content)
+                VALUES ('delete', OLD.id, OLD.title, OLD.content);
+                INSERT INTO industry_fts (rowid, title, content)
+                VALUES (NEW.id, NEW.title, NEW.content);
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS industry_fts_delete
+            AFTER DELETE ON industry_data
+            BEGIN
+                INSERT INTO industry_fts (industry_fts, rowid, title, content)
+                VALUES ('delete', OLD.id, OLD.title, OLD.content);
+            END
+        """)
+
+        if not exists:
+            conn.execute("INSERT INTO industry_fts (industry_fts) VALUES ('rebuild')")
+
+    def create_client(self, telegram_handle: str, email: str, industry: str,
                      location: str, campaign_parameters: Dict[str, Any]) -> bool:
         """Create a new client record."""
+        self._client_cache.pop(telegram_handle, None)
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("""
-                    INSERT INTO clients 
-                    (telegram_handle, email, industry, location, campaign_parameters)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (
+            with self._write() as conn:
+                conn.execute(self._SQL_INSERT_CLIENT, (
+                    self.client_id,
                     telegram_handle,
                     email,
                     industry,
                     location,
-                    json.dumps(campaign_parameters)
+                    _json_dumps(campaign_parameters)
                 ))
                 return True
         except sqlite3.IntegrityError:
             return False
 
     def get_client(self, telegram_handle: str) -> Optional[Dict[str, Any]]:
-        """Retrieve client information."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        """
+        Retrieve client information.
+
+        Rows are decoded once and cached per manager. Each call returns a new
+        top-level dict, but the campaign_parameters value is shared between
+        calls and must not be mutated in place.
+        """
+        cached = self._client_cache.get(telegram_handle)
+        if cached is not None:
+            return dict(cached)
+
+        with self._read() as conn:
             cursor = conn.execute(
-                "SELECT * FROM clients WHERE telegram_handle = ?", 
-                (telegram_handle,)
+                self._SQL_GET_CLIENT, (self.client_id, telegram_handle)
             )
             row = cursor.fetchone()
             if row:
                 client_data = dict(row)
-                client_data['campaign_parameters'] = json.loads(
+                client_data['campaign_parameters'] = _json_loads(
                     client_data['campaign_parameters']
                 )
-                return client_data
+                self._client_cache[telegram_handle] = client_data
+                return dict(client_data)
             return None
 
     def add_industry_data(self, source: str, content: str, pain_points: str,
@@ -138,376 +746,417 @@ class DatabaseManager:
                          crawled_at: Optional[str] = None) -> int:
         """
         Add new industry data entry.
-        
+
         Args:
             source: URL or source of the data
-            content: The actual content in markdown format
+            content: The actual content as plain text or markdown
             pain_points: Extracted pain points
             title: Optional title of the content
             tags: Optional list of tags for categorization
             crawled_at: Optional ISO format timestamp of when the data was crawled
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("""
-                INSERT INTO industry_data 
-                (source, title, content, pain_points, tags, crawled_at)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (
+        with self._write() as conn:
+            cursor = conn.execute(self._SQL_INSERT_INDUSTRY_DATA, (
+                self.client_id,
                 source,
                 title,
                 content,
                 pain_points,
-                json.dumps(tags) if tags else None,
+                _json_dumps(tags) if tags else None,
                 crawled_at
             ))
             return cursor.lastrowid
 
+    def add_industry_data_bulk(self, entries: List[Dict[str, Any]]) -> List[int]:
+        """
+        Add several industry data entries in a single transaction.
+
+        Args:
+            entries: Dicts with the same keys as the add_industry_data arguments
+        """
+        return self._insert_many(self._SQL_INSERT_INDUSTRY_DATA, [
+            (
+                self.client_id,
+                entry['source'],
+                entry.get('title'),
+                entry['content'],
+                entry['pain_points'],
+                _json_dumps(entry['tags']) if entry.get('tags') else None,
+                entry.get('crawled_at')
+            )
+            for entry in entries
+        ])
+
+    @staticmethod
+    def _industry_row(row: sqlite3.Row) -> Dict[str, Any]:
+        """Convert an industry_data row to a dict with its tags decoded."""
+        data = dict(row)
+        if data['tags']:
+            try:
+                data['tags'] = _json_loads(data['tags'])
+            except json.JSONDecodeError:
+                data['tags'] = None
+        return data
+
     def get_industry_data(self, limit: int = 10, tags: Optional[List[str]] = None) -> list:
         """
         Retrieve recent industry data entries.
-        
+
         Args:
             limit: Maximum number of entries to return
             tags: Optional list of tags to filter by
         """
-        with sqlite3.connect(self.db_path) as conn:
-            # Register JSON array contains function
-            conn.create_function("json_array_contains", 2, self._json_array_contains)
-            conn.row_factory = sqlite3.Row
-            
+        return list(self.iter_industry_data(limit, tags))
+
+    def iter_industry_data(self, limit: int = 10,
+                           tags: Optional[List[str]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Yield recent industry data entries one at a time.
+
+        A read connection is held until the generator is exhausted or closed.
+
+        Args:
+            limit: Maximum number of entries to yield
+            tags: Optional list of tags to filter by
+        """
+        with self._read() as conn:
             if tags:
-                # Build query to match any of the provided tags
-                tag_conditions = ' OR '.join(
-                    f"json_array_contains(tags, ?)" for _ in tags
-                )
+                # Match any of the provided tags
+                tag_filter, tag_params = self._tag_filter(tags)
                 cursor = conn.execute(f"""
-                    SELECT * FROM industry_data 
-                    WHERE {tag_conditions}
+                    SELECT * FROM industry_data
+                    WHERE client_id = ? AND {tag_filter}
                     ORDER BY created_at DESC LIMIT ?
-                """, [*tags, limit])
+                """, [self.client_id, *tag_params, limit])
             else:
-                cursor = conn.execute(
-                    "SELECT * FROM industry_data ORDER BY created_at DESC LIMIT ?",
-                    (limit,)
-                )
-            
-            results = []
-            for row in cursor.fetchall():
-                data = dict(row)
-                if data['tags']:
-                    try:
-                        data['tags'] = json.loads(data['tags'])
-                    except json.JSONDecodeError:
-                        data['tags'] = None
-                results.append(data)
-            return results
+                cursor = conn.execute("""
+                    SELECT * FROM industry_data WHERE client_id = ?
+                    ORDER BY created_at DESC LIMIT ?
+                """, (self.client_id, limit))
+
+            for row in cursor:
+                yield self._industry_row(row)
+
+    def get_cached_pain_points(self, content_hash: str,
+                               max_age: Optional[timedelta] = None) -> Optional[str]:
+        """
+        Get the pain points cached for a content hash, if any.
+
+        Args:
+            content_hash: Hash of the analysed content
+            max_age: Optional age after which a cached result is ignored
+        """
+        with self._read() as conn:
+            query = "SELECT pain_points FROM pain_point_cache WHERE content_hash = ?"
+            params: List[Any] = [content_hash]
+            if max_age is not None:
+                query += " AND created_at > datetime('now', ?)"
+                params.append(f"-{int(max_age.total_seconds())} seconds")
+            row = conn.execute(query, params).fetchone()
+            return row['pain_points'] if row else None
+
+    def cache_pain_points(self, content_hash: str, pain_points: str):
+        """Cache the pain points extracted for a content hash."""
+        self.cache_pain_points_bulk([(content_hash, pain_points)])
+
+    def cache_pain_points_bulk(self, rows: List[Tuple[str, str]]):
+        """
+        Cache several (content_hash, pain_points) results in one transaction,
+        joining the caller's transaction() if one is open.
+        """
+        if not rows:
+            return
+        with self.transaction() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO pain_point_cache (content_hash, pain_points) VALUES (?, ?)",
+                rows
+            )
+
+    def prune_pain_point_cache(self, max_age: timedelta) -> int:
+        """Delete cached pain points older than max_age and return how many."""
+        with self._write() as conn:
+            return conn.execute(
+                "DELETE FROM pain_point_cache WHERE created_at <= datetime('now', ?)",
+                (f"-{int(max_age.total_seconds())} seconds",)
+            ).rowcount
+
+    def get_industry_data_by_source(self, source: str,
+                                    crawled_after: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve the most recently crawled industry data entry for a source.
+
+        Args:
+            source: URL or source of the data
+            crawled_after: Optional ISO format timestamp; older entries are ignored
+        """
+        with self._read() as conn:
+            query = "SELECT * FROM industry_data WHERE client_id = ? AND source = ?"
+            params = [self.client_id, source]
+            if crawled_after:
+                query += " AND crawled_at >= ?"
+                params.append(crawled_after)
+            query += " ORDER BY crawled_at DESC LIMIT 1"
+
+            row = conn.execute(query, params).fetchone()
+            return self._industry_row(row) if row else None
 
     def search_industry_data(self, keyword: str, tags: Optional[List[str]] = None) -> list:
         """
         Search industry data by keyword and optionally filter by tags.
-        
+
+        Uses the FTS5 index when available (best matches first) and falls
+        back to a LIKE scan ordered by recency otherwise.
+
         Args:
             keyword: Search term
             tags: Optional list of tags to filter by
         """
-        with sqlite3.connect(self.db_path) as conn:
-            # Register JSON array contains function
-            conn.create_function("json_array_contains", 2, self._json_array_contains)
-            conn.row_factory = sqlite3.Row
-            
-            if tags:
-                # Build query to match any of the provided tags
-                tag_conditions = ' OR '.join(
-                    f"json_array_contains(tags, ?)" for _ in tags
-                )
-                cursor = conn.execute(f"""
-                    SELECT * FROM industry_data 
-                    WHERE ({tag_conditions})
-                    AND (content LIKE ? OR title LIKE ?)
-                    ORDER BY created_at DESC
-                """, [*tags, f"%{keyword}%", f"%{keyword}%"])
+        with self._read() as conn:
+            if self._pool.has_fts5 and keyword.strip():
+                # Quote the keyword as a single FTS5 phrase so operators and
+                # punctuation in user input are matched literally
+                query = """
+                    SELECT industry_data.* FROM industry_fts
+                    JOIN industry_data ON industry_data.id = industry_fts.rowid
+                    WHERE industry_fts MATCH ? AND industry_data.client_id = ?
+                """
+                params = ['"' + keyword.replace('"', '""') + '"', self.client_id]
+                order_by = "rank"
             else:
-                cursor = conn.execute("""
-                    SELECT * FROM industry_data 
-                    WHERE content LIKE ? OR title LIKE ?
-                    ORDER BY created_at DESC
-                """, (f"%{keyword}%", f"%{keyword}%"))
-            
-            results = []
-            for row in cursor.fetchall():
-                data = dict(row)
-                if data['tags']:
-                    try:
-                        data['tags'] = json.loads(data['tags'])
-                    except json.JSONDecodeError:
-                        data['tags'] = None
-                results.append(data)
-            return results
-
-    def add_lead(self, company_name: str, website: str, 
+                query = """
+                    SELECT * FROM industry_data
+                    WHERE client_id = ?
+                      AND (content LIKE ? ESCAPE '\\' OR title LIKE ? ESCAPE '\\')
+                """
+                # Escape LIKE wildcards so the keyword matches literally
+                pattern = f"%{keyword.translate(_LIKE_ESCAPES)}%"
+                params = [self.client_id, pattern, pattern]
+                order_by = "created_at DESC"
+
+            if tags:
+                # Match any of the provided tags
+                tag_filter, tag_params = self._tag_filter(tags)
+                query += f" AND {tag_filter}"
+                params.extend(tag_params)
+
+            cursor = conn.execute(f"{query} ORDER BY {order_by}", params)
+            return [self._industry_row(row) for row in cursor]
+
+    def add_lead(self, company_name: str, website: str,
                 contact_info: str, details: str) -> int:
         """Add new lead to the bucket."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("""
-                INSERT INTO lead_bucket 
-                (company_name, website, contact_info, details)
-                VALUES (?, ?, ?, ?)
-            """, (company_name, website, contact_info, details))
+        with self._write() as conn:
+            cursor = conn.execute(
+                self._SQL_INSERT_LEAD,
+                (self.client_id, company_name, website, contact_info, details)
+            )
             return cursor.lastrowid
 
+    def add_leads_bulk(self, leads: List[Dict[str, Any]]) -> List[int]:
+        """
+        Add several leads to the bucket in a single transaction.
+
+        Args:
+            leads: Dicts with the same keys as the add_lead arguments
+        """
+        return self._insert_many(self._SQL_INSERT_LEAD, [
+            (self.client_id, lead['company_name'], lead['website'],
+             lead['contact_info'], lead['details'])
+            for lead in leads
+        ])
+
     def add_solution(self, lead_id: int, solution_text: str) -> int:
         """Add new tailored solution."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("""
-                INSERT INTO tailored_solutions (lead_id, solution_text)
-                VALUES (?, ?)
-            """, (lead_id, solution_text))
+        with self._write() as conn:
+            cursor = conn.execute(
+                self._SQL_INSERT_SOLUTION, (self.client_id, lead_id, solution_text)
+            )
             return cursor.lastrowid
 
+    def add_solutions_bulk(self, solutions: List[Dict[str, Any]]) -> List[int]:
+        """
+        Add several tailored solutions in a single transaction.
+
+        Args:
+            solutions: Dicts with the same keys as the add_solution arguments
+        """
+        return self._insert_many(self._SQL_INSERT_SOLUTION, [
+            (self.client_id, solution['lead_id'], solution['solution_text'])
+            for solution in solutions
+        ])
+
     def log_outreach(self, lead_id: int, message_sent: str) -> int:
         """Log new outreach attempt."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("""
-                INSERT INTO outreach_log (lead_id, message_sent)
-                VALUES (?, ?)
-            """, (lead_id, message_sent))
+        with self._write() as conn:
+            cursor = conn.execute(
+                self._SQL_INSERT_OUTREACH, (self.client_id, lead_id, message_sent)
+            )
             return cursor.lastrowid
 
     def update_outreach_response(self, outreach_id: int, response: str) -> bool:
         """Update outreach log with response."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._write() as conn:
                 conn.execute("""
-                    UPDATE outreach_log 
+                    UPDATE outreach_log
                     SET response = ?, updated_at = CURRENT_TIMESTAMP
-                    WHERE id = ?
-                """, (response, outreach_id))
+                    WHERE id = ? AND client_id = ?
+                """, (response, outreach_id, self.client_id))
                 return True
         except sqlite3.Error:
             return False
 
-    # Industry Data Methods
-    def get_industry_data(self, limit: int = 10, tags: Optional[List[str]] = None) -> list:
-        """
-        Retrieve recent industry data entries.
-        
-        Args:
-            limit: Maximum number of entries to return
-            tags: Optional list of tags to filter by
-        """
-        with sqlite3.connect(self.db_path) as conn:
-            # Register JSON array contains function
-            conn.create_function("json_array_contains", 2, self._json_array_contains)
-            conn.row_factory = sqlite3.Row
-            
-            if tags:
-                # Build query to match any of the provided tags
-                tag_conditions = ' OR '.join(
-                    f"json_array_contains(tags, ?)" for _ in tags
-                )
-                cursor = conn.execute(f"""
-                    SELECT * FROM industry_data 
-                    WHERE {tag_conditions}
-                    ORDER BY created_at DESC LIMIT ?
-                """, [*tags, limit])
-            else:
-                cursor = conn.execute(
-                    "SELECT * FROM industry_data ORDER BY created_at DESC LIMIT ?",
-                    (limit,)
-                )
-            
-            results = []
-            for row in cursor.fetchall():
-                data = dict(row)
-                if data['tags']:
-                    try:
-                        data['tags'] = json.loads(data['tags'])
-                    except json.JSONDecodeError:
-                        data['tags'] = None
-                results.append(data)
-            return results
-
-    def search_industry_data(self, keyword: str, tags: Optional[List[str]] = None) -> list:
-        """
-        Search industry data by keyword and optionally filter by tags.
-        
-        Args:
-            keyword: Search term
-            tags: Optional list of tags to filter by
-        """
-        with sqlite3.connect(self.db_path) as conn:
-            # Register JSON array contains function
-            conn.create_function("json_array_contains", 2, self._json_array_contains)
-            conn.row_factory = sqlite3.Row
-            
-            if tags:
-                # Build query to match any of the provided tags
-                tag_conditions = ' OR '.join(
-                    f"json_array_contains(tags, ?)" for _ in tags
-                )
-                cursor = conn.execute(f"""
-                    SELECT * FROM industry_data 
-                    WHERE ({tag_conditions})
-                    AND (content LIKE ? OR title LIKE ?)
-                    ORDER BY created_at DESC
-                """, [*tags, f"%{keyword}%", f"%{keyword}%"])
-            else:
-                cursor = conn.execute("""
-                    SELECT * FROM industry_data 
-                    WHERE content LIKE ? OR title LIKE ?
-                    ORDER BY created_at DESC
-                """, (f"%{keyword}%", f"%{keyword}%"))
-            
-            results = []
-            for row in cursor.fetchall():
-                data = dict(row)
-                if data['tags']:
-                    try:
-                        data['tags'] = json.loads(data['tags'])
-                    except json.JSONDecodeError:
-                        data['tags'] = None
-                results.append(data)
-            return results
-
     # Lead Management Methods
     def get_leads(self, status: Optional[str] = None, limit: int = 50) -> list:
         """Retrieve leads with optional status filter."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        return list(self.iter_leads(status, limit))
+
+    def iter_leads(self, status: Optional[str] = None,
+                   limit: int = 50) -> Iterator[Dict[str, Any]]:
+        """Yield leads one at a time, with optional status filter."""
+        with self._read() as conn:
+            # One row per lead, carrying the status of its latest solution
             query = """
-                SELECT lb.*, ts.status 
-                FROM lead_bucket lb
-                LEFT JOIN tailored_solutions ts ON lb.id = ts.lead_id
+                SELECT * FROM (
+                    SELECT lb.*, (
+                        SELECT ts.status FROM tailored_solutions ts
+                        WHERE ts.lead_id = lb.id
+                        ORDER BY ts.generated_at DESC, ts.id DESC
+                        LIMIT 1
+                    ) AS status
+                    FROM lead_bucket lb
+                    WHERE lb.client_id = ?
+                )
             """
-            params = []
+            params = [self.client_id]
             if status:
-                query += " WHERE ts.status = ?"
+                query += " WHERE status = ?"
                 params.append(status)
-            query += " ORDER BY lb.created_at DESC LIMIT ?"
+            query += " ORDER BY created_at DESC LIMIT ?"
             params.append(limit)
-            
-            cursor = conn.execute(query, params)
-            return [dict(row) for row in cursor.fetchall()]
+
+            for row in conn.execute(query, params):
+                yield dict(row)
 
     def update_lead(self, lead_id: int, updates: Dict[str, Any]) -> bool:
         """Update lead information."""
         valid_fields = {'company_name', 'website', 'contact_info', 'details'}
-        update_fields = {k: v for k, v in updates.items() if k in valid_fields}
-        
-        if not update_fields:
+        # Sort the fields so the same set of updates always yields the same
+        # SQL text and reuses its prepared statement
+        fields = tuple(sorted(k for k in updates if k in valid_fields))
+
+        if not fields:
             return False
-        
+
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                set_clause = ", ".join(f"{k} = ?" for k in update_fields)
-                query = f"UPDATE lead_bucket SET {set_clause} WHERE id = ?"
-                params = list(update_fields.values()) + [lead_id]
-                conn.execute(query, params)
+            with self._write() as conn:
+                params = [updates[field] for field in fields]
+                params += [lead_id, self.client_id]
+                conn.execute(self._update_lead_sql(fields), params)
                 return True
         except sqlite3.Error:
             return False
 
     # Solution Management Methods
-    def get_solutions(self, lead_id: Optional[int] = None, 
+    def get_solutions(self, lead_id: Optional[int] = None,
                      status: Optional[str] = None) -> list:
         """Retrieve solutions with optional filters."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            query = "SELECT * FROM tailored_solutions WHERE 1=1"
-            params = []
-            
+        return list(self.iter_solutions(lead_id, status))
+
+    def iter_solutions(self, lead_id: Optional[int] = None,
+                       status: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Yield solutions one at a time, with optional filters."""
+        with self._read() as conn:
+            query = "SELECT * FROM tailored_solutions WHERE client_id = ?"
+            params = [self.client_id]
+
             if lead_id is not None:
                 query += " AND lead_id = ?"
                 params.append(lead_id)
             if status:
                 query += " AND status = ?"
                 params.append(status)
-            
+
             query += " ORDER BY generated_at DESC"
-            cursor = conn.execute(query, params)
-            return [dict(row) for row in cursor.fetchall()]
+            for row in conn.execute(query, params):
+                yield dict(row)
 
     def update_solution_status(self, solution_id: int, status: str) -> bool:
         """Update solution status."""
         valid_statuses = {'pending', 'sent', 'reviewed', 'approved', 'rejected'}
         if status not in valid_statuses:
             return False
-        
+
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._write() as conn:
                 conn.execute("""
-                    UPDATE tailored_solutions 
-                    SET status = ? 
-                    WHERE id = ?
-                """, (status, solution_id))
+                    UPDATE tailored_solutions
+                    SET status = ?
+                    WHERE id = ? AND client_id = ?
+                """, (status, solution_id, self.client_id))
                 return True
         except sqlite3.Error:
             return False
 
     # Outreach Management Methods
-    def get_outreach_history(self, lead_id: Optional[int] = None, 
+    def get_outreach_history(self, lead_id: Optional[int] = None,
                            limit: int = 50) -> list:
         """Retrieve outreach history."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        return list(self.iter_outreach_history(lead_id, limit))
+
+    def iter_outreach_history(self, lead_id: Optional[int] = None,
+                              limit: int = 50) -> Iterator[Dict[str, Any]]:
+        """Yield outreach history entries one at a time."""
+        with self._read() as conn:
             query = """
-                SELECT ol.*, lb.company_name 
+                SELECT ol.*, lb.company_name
                 FROM outreach_log ol
                 JOIN lead_bucket lb ON ol.lead_id = lb.id
+                WHERE ol.client_id = ?
             """
-            params = []
-            
+            params = [self.client_id]
+
             if lead_id is not None:
-                query += " WHERE ol.lead_id = ?"
+                query += " AND ol.lead_id = ?"
                 params.append(lead_id)
-            
+
             query += " ORDER BY ol.sent_at DESC LIMIT ?"
             params.append(limit)
-            
-            cursor = conn.execute(query, params)
-            return [dict(row) for row in cursor.fetchall()]
+
+            for row in conn.execute(query, params):
+                yield dict(row)
 
     def get_pending_responses(self) -> list:
         """Get outreach entries without responses."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._read() as conn:
             cursor = conn.execute("""
-                SELECT ol.*, lb.company_name 
+                SELECT ol.*, lb.company_name
                 FROM outreach_log ol
                 JOIN lead_bucket lb ON ol.lead_id = lb.id
-                WHERE ol.response IS NULL
+                WHERE ol.client_id = ? AND ol.response IS NULL
                 ORDER BY ol.sent_at DESC
-            """)
-            return [dict(row) for row in cursor.fetchall()]
+            """, (self.client_id,))
+            return [dict(row) for row in cursor]
 
     # Analytics Methods
     def get_campaign_stats(self) -> Dict[str, Any]:
         """Get campaign statistics."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            
-            # Get lead counts
-            cursor = conn.execute("SELECT COUNT(*) as total FROM lead_bucket")
-            lead_count = cursor.fetchone()['total']
-            
-            # Get solution stats
-            cursor = conn.execute("""
-                SELECT status, COUNT(*) as count 
-                FROM tailored_solutions 
-                GROUP BY status
-            """)
-            solution_stats = {row['status']: row['count'] 
-                            for row in cursor.fetchall()}
-            
-            # Get outreach stats
-            cursor = conn.execute("""
-                SELECT 
-                    COUNT(*) as total_outreach,
-                    SUM(CASE WHEN response IS NOT NULL THEN 1 ELSE 0 END) as responses
-                FROM outreach_log
-            """)
-            outreach_stats = dict(cursor.fetchone())
-            
+        with self._read() as conn:
+            # One statement for all three aggregates: a single 'totals' row
+            # followed by one 'solution' row per status
+            lead_count = 0
+            solution_stats = {}
+            outreach_stats = {'total_outreach': 0, 'responses': None}
+            for row in conn.execute(self._SQL_CAMPAIGN_STATS, (self.client_id,)):
+                if row['kind'] == 'totals':
+                    lead_count = row['total_leads']
+                    outreach_stats = {
+                        'total_outreach': row['total_outreach'],
+                        'responses': row['responses']
+                    }
+                else:
+                    solution_stats[row['status']] = row['count']
+
             return {
                 'total_leads': lead_count,
                 'solution_stats': solution_stats,
@@ -516,21 +1165,69 @@ class DatabaseManager:
 
     def export_campaign_data(self) -> Dict[str, Any]:
         """Export all campaign data for reporting."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            
-            # Get client info
-            cursor = conn.execute("SELECT * FROM clients LIMIT 1")
-            client_info = dict(cursor.fetchone())
-            
-            # Get all data
-            data = {
-                'client_info': client_info,
-                'industry_data': self.get_industry_data(limit=1000),
-                'leads': self.get_leads(limit=1000),
-                'solutions': self.get_solutions(),
-                'outreach_history': self.get_outreach_history(limit=1000),
-                'campaign_stats': self.get_campaign_stats()
-            }
-            
+        with self._read() as conn:
+            # Read every section on this connection from a single snapshot;
+            # the section getters below reuse it through the nested _read()
+            conn.execute("BEGIN")
+            try:
+                # Get client info
+                cursor = conn.execute(
+                    "SELECT * FROM clients WHERE client_id = ? LIMIT 1",
+                    (self.client_id,)
+                )
+                client_info = dict(cursor.fetchone())
+
+                # Get all data
+                data = {
+                    'client_info': client_info,
+                    'industry_data': self.get_industry_data(limit=1000),
+                    'leads': self.get_leads(limit=1000),
+                    'solutions': self.get_solutions(),
+                    'outreach_history': self.get_outreach_history(limit=1000),
+                    'campaign_stats': self.get_campaign_stats()
+                }
+            finally:
+                conn.execute("COMMIT")
+
             return data
+
+    def write_campaign_export(self, fp: IO[str]):
+        """
+        Write the export_campaign_data sections to fp as one JSON object.
+
+        Rows are serialized as they are read instead of being collected into
+        lists first, so memory use stays flat for large campaigns.
+
+        Args:
+            fp: Text file object to write the JSON document to
+        """
+        with self._read() as conn:
+            # Same single-snapshot read as export_campaign_data
+            conn.execute("BEGIN")
+            try:
+                cursor = conn.execute(
+                    "SELECT * FROM clients WHERE client_id = ? LIMIT 1",
+                    (self.client_id,)
+                )
+                fp.write('{"client_info": ')
+                fp.write(_json_dumps(dict(cursor.fetchone())))
+
+                sections = (
+                    ('industry_data', self.iter_industry_data(limit=1000)),
+                    ('leads', self.iter_leads(limit=1000)),
+                    ('solutions', self.iter_solutions()),
+                    ('outreach_history', self.iter_outreach_history(limit=1000)),
+                )
+                for key, rows in sections:
+                    fp.write(f', "{key}": [')
+                    for i, row in enumerate(rows):
+                        if i:
+                            fp.write(', ')
+                        fp.write(_json_dumps(row))
+                    fp.write(']')
+
+                fp.write(', "campaign_stats": ')
+                fp.write(_json_dumps(self.get_campaign_stats()))
+                fp.write('}')
+            finally:
+                conn.execute("COMMIT")
@@ -1,4 +1,5 @@
 from db_manager import DatabaseManager
+import io
 import json
 from pprint import pprint
 
@@ -42,8 +43,8 @@ def test_database():
         }
     ]
     
-    for ind in industries:
-        industry_id = db.add_industry_data(**ind)
+    industry_ids = db.add_industry_data_bulk(industries)
+    for industry_id in industry_ids:
         print(f"Industry data added with ID: {industry_id}")
     
     print("\nSearching industry data for 'AI':")
@@ -68,10 +69,8 @@ def test_database():
         }
     ]
     
-    lead_ids = []
-    for lead in leads:
-        lead_id = db.add_lead(**lead)
-        lead_ids.append(lead_id)
+    lead_ids = db.add_leads_bulk(leads)
+    for lead_id in lead_ids:
         print(f"Lead added with ID: {lead_id}")
     
     # Update a lead
@@ -84,11 +83,11 @@ def test_database():
     print("\n4. Testing Solutions Management")
     print("-" * 50)
     # Add solutions for leads
-    for lead_id in lead_ids:
-        solution_id = db.add_solution(
-            lead_id=lead_id,
-            solution_text=f"Custom solution for lead {lead_id}"
-        )
+    solution_ids = db.add_solutions_bulk([
+        {"lead_id": lead_id, "solution_text": f"Custom solution for lead {lead_id}"}
+        for lead_id in lead_ids
+    ])
+    for lead_id, solution_id in zip(lead_ids, solution_ids):
         print(f"Solution added for lead {lead_id} with ID: {solution_id}")
         
         # Update solution status
@@ -97,21 +96,22 @@ def test_database():
     
     print("\n5. Testing Outreach Management")
     print("-" * 50)
-    # Log outreach attempts
-    for lead_id in lead_ids:
-        outreach_id = db.log_outreach(
-            lead_id=lead_id,
-            message_sent=f"Initial contact message for lead {lead_id}"
-        )
-        print(f"Outreach logged for lead {lead_id} with ID: {outreach_id}")
-        
-        # Update some with responses
-        if lead_id == lead_ids[0]:
-            response_updated = db.update_outreach_response(
-                outreach_id=outreach_id,
-                response="Interested in learning more"
+    # Log outreach attempts in a single transaction
+    with db.transaction():
+        for lead_id in lead_ids:
+            outreach_id = db.log_outreach(
+                lead_id=lead_id,
+                message_sent=f"Initial contact message for lead {lead_id}"
             )
-            print(f"Outreach response updated: {response_updated}")
+            print(f"Outreach logged for lead {lead_id} with ID: {outreach_id}")
+
+            # Update some with responses
+            if lead_id == lead_ids[0]:
+                response_updated = db.update_outreach_response(
+                    outreach_id=outreach_id,
+                    response="Interested in learning more"
+                )
+                print(f"Outreach response updated: {response_updated}")
     
     print("\nPending responses:")
     pending = db.get_pending_responses()
@@ -129,5 +129,43 @@ def test_database():
     print(f"Number of leads exported: {len(campaign_data['leads'])}")
     print(f"Number of solutions exported: {len(campaign_data['solutions'])}")
 
+    print("\nStreamed Campaign Export:")
+    buffer = io.StringIO()
+    db.write_campaign_export(buffer)
+    streamed_data = json.loads(buffer.getvalue())
+    print(f"Matches full export: {streamed_data == campaign_data}")
+
+    print("\n7. Testing Interleaved Readers")
+    print("-" * 50)
+    # The outer generator finishes first; the shared read connection must
+    # stay borrowed until the inner one is closed too
+    pairs = list(zip(db.iter_leads(), db.iter_solutions()))
+    leads = db.iter_leads()
+    solutions = db.iter_solutions()
+    next(leads)
+    next(solutions)
+    leads.close()
+    next(solutions, None)
+    solutions.close()
+    print(f"Zipped rows: {len(pairs)}")
+    print(f"Reads after out-of-order close: {len(db.get_leads())} leads, "
+          f"stats readable: {bool(db.get_campaign_stats())}")
+
+    print("\n8. Testing Nested Transactions")
+    print("-" * 50)
+    lead_row = {"company_name": "Nested Co", "website": "https://nested.example",
+                "contact_info": "n@nested.example", "details": "Nested transaction"}
+    with db.transaction():
+        nested_ids = db.add_leads_bulk([lead_row])
+        db.log_outreach(nested_ids[0], "Nested hello")
+    print(f"Bulk insert inside transaction: {nested_ids}")
+    try:
+        with db.transaction():
+            db.add_leads_bulk([lead_row])
+            raise RuntimeError("rollback")
+    except RuntimeError:
+        pass
+    print(f"Leads after rollback: {db.get_campaign_stats()['total_leads']}")
+
 if __name__ == "__main__":
     test_database()
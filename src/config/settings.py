@@ -1,26 +1,34 @@
 import os
-from typing import Dict, Any
+import logging
+from functools import cached_property
+from typing import Dict, Any, Optional
 from dotenv import load_dotenv
 
-def debug_print(class_name: str, function_name: str, detail: str):
-    print(f"[settings][{class_name}][{function_name}] {detail}")
+logger = logging.getLogger(__name__)
+
+def debug_print(class_name: str, function_name: str, detail: str, *args: Any):
+    # detail is a %-format string; args are only formatted if DEBUG is enabled
+    logger.debug("[settings][%s][%s] " + detail, class_name, function_name, *args)
 
 class Settings:
     def __init__(self):
         load_dotenv()
         debug_print("Settings", "__init__", "Loading environment variables")
-        
+
         self.telegram_token = os.getenv("TELEGRAM_BOT_TOKEN")
         if not self.telegram_token:
             raise ValueError("TELEGRAM_BOT_TOKEN not found in environment")
-            
-        self.azure_openai = {
+        debug_print("Settings", "__init__", "Initialized with all settings")
+
+    @cached_property
+    def azure_openai(self) -> Dict[str, Any]:
+        """Azure OpenAI configuration, read from the environment on first use."""
+        return {
             "endpoint": os.getenv("AZURE_OPENAI_ENDPOINT"),
             "api_key": os.getenv("AZURE_OPENAI_KEY"),
             "model_name": os.getenv("MODEL_NAME"),
             "api_version": os.getenv("API_VERSION")
         }
-        debug_print("Settings", "__init__", "Initialized with all settings")
 
     def get_azure_openai_config(self) -> Dict[str, Any]:
         """Get Azure OpenAI configuration."""
@@ -30,4 +38,18 @@ class Settings:
         """Get Telegram bot token."""
         return self.telegram_token
 
-settings = Settings()
+_instance: Optional[Settings] = None
+
+def get_settings() -> Settings:
+    """Return the shared Settings instance, loading it on first call."""
+    global _instance
+    if _instance is None:
+        _instance = Settings()
+    return _instance
+
+def __getattr__(name: str) -> Any:
+    # Keep `from src.config.settings import settings` working without
+    # loading the environment at import time
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
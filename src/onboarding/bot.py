@@ -1,12 +1,36 @@
-from telegram import Update
+import asyncio
+import sys
+from telegram import Message, Update
 from telegram.ext import Application, CommandHandler, MessageHandler, filters, ContextTypes, ConversationHandler
+from dataclasses import dataclass
 from typing import Dict, Any
 import json
+import logging
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from database.db_manager import DatabaseManager
 
-def debug_print(class_name: str, function_name: str, detail: str):
-    print(f"[bot][{class_name}][{function_name}] {detail}")
+# Use the libuv-based event loop where available (not supported on Windows)
+if sys.platform != "win32":
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
+# orjson parses several times faster; its JSONDecodeError subclasses
+# json.JSONDecodeError, so the handlers below catch either
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+logger = logging.getLogger(__name__)
+
+def debug_print(class_name: str, function_name: str, detail: str, *args: Any):
+    # detail is a %-format string; args are only formatted if DEBUG is enabled
+    logger.debug("[bot][%s][%s] " + detail, class_name, function_name, *args)
 
 # Conversation states
 EMAIL = 0
@@ -14,12 +38,26 @@ INDUSTRY = 1
 LOCATION = 2
 CAMPAIGN_PARAMS = 3
 
+# Campaign parameter messages longer than this are rejected without parsing
+MAX_CAMPAIGN_PARAMS_LENGTH = 4096
+
+@dataclass
+class Onboarding:
+    """Onboarding answers collected so far, stored as one user_data entry."""
+    client_id: str
+    display_name: str
+    email: str = ""
+    industry: str = ""
+    location: str = ""
+
 class OnboardingBot:
     def __init__(self, token: str):
         """Initialize the onboarding bot."""
         self.token = token
         self.app = Application.builder().token(token).build()
-        debug_print("OnboardingBot", "__init__", f"Initializing bot")
+        # One DatabaseManager per client, reused across handler calls
+        self._db_cache: Dict[str, DatabaseManager] = {}
+        debug_print("OnboardingBot", "__init__", "Initializing bot")
         self._setup_handlers()
 
     def _setup_handlers(self):
@@ -37,6 +75,12 @@ class OnboardingBot:
         self.app.add_handler(conv_handler)
         debug_print("OnboardingBot", "_setup_handlers", "Handlers configured")
 
+    def _db(self, client_id: str) -> DatabaseManager:
+        """Get the cached DatabaseManager for a client, creating it if needed."""
+        if client_id not in self._db_cache:
+            self._db_cache[client_id] = DatabaseManager(client_id)
+        return self._db_cache[client_id]
+
     async def start(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
         """Start the onboarding conversation."""
         user = update.effective_user
@@ -47,14 +91,13 @@ class OnboardingBot:
         client_id = telegram_handle if telegram_handle else user_id
         display_name = f"@{telegram_handle}" if telegram_handle else f"User {user_id}"
         
-        debug_print("OnboardingBot", "start", f"Starting onboarding for {display_name}")
+        debug_print("OnboardingBot", "start", "Starting onboarding for %s", display_name)
         
         # Store user info in context
-        context.user_data['client_id'] = client_id
-        context.user_data['display_name'] = display_name
+        context.user_data['ob'] = Onboarding(client_id=client_id, display_name=display_name)
         
         # Initialize database for this client
-        db = DatabaseManager(client_id)
+        db = self._db(client_id)
         
         await update.message.reply_text(
             f"Welcome to Gorilla7, {display_name}!\n"
@@ -65,33 +108,42 @@ class OnboardingBot:
 
     async def handle_email(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
         """Handle email collection."""
-        context.user_data['email'] = update.message.text
+        ob = context.user_data['ob']
+        msg = update.message
+        text = msg.text
+        ob.email = text
         debug_print("OnboardingBot", "handle_email", 
-                   f"Email for {context.user_data['display_name']}: {update.message.text}")
+                   "Email for %s: %s", ob.display_name, text)
         
-        await update.message.reply_text(
+        await msg.reply_text(
             "What industry are you targeting?"
         )
         return INDUSTRY
 
     async def handle_industry(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
         """Handle industry collection."""
-        context.user_data['industry'] = update.message.text
+        ob = context.user_data['ob']
+        msg = update.message
+        text = msg.text
+        ob.industry = text
         debug_print("OnboardingBot", "handle_industry", 
-                   f"Industry for {context.user_data['display_name']}: {update.message.text}")
+                   "Industry for %s: %s", ob.display_name, text)
         
-        await update.message.reply_text(
+        await msg.reply_text(
             "What's your target location/region?"
         )
         return LOCATION
 
     async def handle_location(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
         """Handle location collection."""
-        context.user_data['location'] = update.message.text
+        ob = context.user_data['ob']
+        msg = update.message
+        text = msg.text
+        ob.location = text
         debug_print("OnboardingBot", "handle_location", 
-                   f"Location for {context.user_data['display_name']}: {update.message.text}")
+                   "Location for %s: %s", ob.display_name, text)
         
-        await update.message.reply_text(
+        await msg.reply_text(
             "Finally, let's set up your campaign parameters.\n"
             "Please provide the following in JSON format:\n"
             "{\n"
@@ -104,48 +156,60 @@ class OnboardingBot:
 
     async def handle_campaign_params(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
         """Handle campaign parameters collection and complete onboarding."""
+        msg = update.message
+        text = msg.text
+        # Reject oversized or obviously non-object input before parsing it
+        if len(text) > MAX_CAMPAIGN_PARAMS_LENGTH or not text.lstrip().startswith("{"):
+            return await self._reply_invalid_campaign_params(msg)
+
         try:
-            campaign_params = json.loads(update.message.text)
+            campaign_params = _json_loads(text)
+            ob = context.user_data['ob']
             debug_print("OnboardingBot", "handle_campaign_params", 
-                       f"Campaign params for {context.user_data['display_name']}: {campaign_params}")
+                       "Campaign params for %s: %s", ob.display_name, campaign_params)
             
             # Create client in database
-            db = DatabaseManager(context.user_data['client_id'])
+            db = self._db(ob.client_id)
             success = db.create_client(
-                telegram_handle=context.user_data['display_name'],
-                email=context.user_data['email'],
-                industry=context.user_data['industry'],
-                location=context.user_data['location'],
+                telegram_handle=ob.display_name,
+                email=ob.email,
+                industry=ob.industry,
+                location=ob.location,
                 campaign_parameters=campaign_params
             )
             
             if success:
-                await update.message.reply_text(
+                await msg.reply_text(
                     "🎉 Onboarding complete! Your campaign is ready to start.\n"
                     "Use /status to check your campaign progress."
                 )
             else:
-                await update.message.reply_text(
+                await msg.reply_text(
                     "⚠️ There was an issue creating your profile. Please try again with /start"
                 )
             
             return ConversationHandler.END
             
         except json.JSONDecodeError:
-            await update.message.reply_text(
-                "Invalid JSON format. Please try again with the correct format:\n"
-                "{\n"
-                '    "iteration_count": number,\n'
-                '    "search_depth": number,\n'
-                '    "lead_quantity": number\n'
-                "}"
-            )
-            return CAMPAIGN_PARAMS
+            return await self._reply_invalid_campaign_params(msg)
+
+    async def _reply_invalid_campaign_params(self, msg: Message) -> int:
+        """Ask for the campaign parameters again after invalid input."""
+        await msg.reply_text(
+            "Invalid JSON format. Please try again with the correct format:\n"
+            "{\n"
+            '    "iteration_count": number,\n'
+            '    "search_depth": number,\n'
+            '    "lead_quantity": number\n'
+            "}"
+        )
+        return CAMPAIGN_PARAMS
 
     async def cancel(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
         """Cancel the conversation."""
-        display_name = context.user_data.get('display_name', f"User {update.effective_user.id}")
-        debug_print("OnboardingBot", "cancel", f"Onboarding cancelled for {display_name}")
+        ob = context.user_data.get('ob')
+        display_name = ob.display_name if ob else f"User {update.effective_user.id}"
+        debug_print("OnboardingBot", "cancel", "Onboarding cancelled for %s", display_name)
         await update.message.reply_text("Onboarding cancelled. Use /start to begin again.")
         return ConversationHandler.END
 
@@ -1,141 +1,627 @@
 import asyncio
 import sys
 import os
-from playwright.async_api import async_playwright
-from bs4 import BeautifulSoup
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+import httpx
+from playwright.async_api import async_playwright, Browser, BrowserContext, Playwright, Route
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from selectolax.parser import HTMLParser
 from markdownify import markdownify as md
-from datetime import datetime
+from datetime import datetime, timedelta
 import json
+import hashlib
+import logging
+import re
+from urllib.parse import urlsplit
 
 # Add project root to Python path
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../.."))
 sys.path.insert(0, project_root)
 
-from typing import List, Dict, Any, Optional
+# Use the libuv-based event loop where available (not supported on Windows)
+if sys.platform != "win32":
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
+from typing import List, Dict, Any, Optional, Set, Tuple
 from database.db_manager import DatabaseManager
 
-def debug_print(class_name: str, function_name: str, detail: str):
-    """Print debug messages in the standard format."""
-    print(f"[industry_crawler][{class_name}][{function_name}] {detail}")
+# Parser processes are started fresh instead of forked from the running event
+# loop and its threads; forkserver is not available on Windows
+_MP_CONTEXT = "forkserver" if sys.platform != "win32" else "spawn"
+
+_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+# Sent by both the HTTP client and the browser pages
+_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Sec-Fetch-User': '?1',
+    'Upgrade-Insecure-Requests': '1'
+}
+
+# Headers of the plain HTTP client; the browser sets its user agent itself
+_HTTP_HEADERS = {**_HEADERS, 'User-Agent': _USER_AGENT}
+
+logger = logging.getLogger(__name__)
+
+# Resource types the browser does not download; they do not affect the
+# extracted text
+_BLOCKED_RESOURCE_TYPES = {"image", "stylesheet", "font", "media"}
+
+# Ad and analytics hosts whose requests are aborted (subdomains included)
+_BLOCKED_DOMAINS = (
+    "doubleclick.net",
+    "googlesyndication.com",
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googletagservices.com",
+    "facebook.net",
+    "hotjar.com",
+    "segment.io",
+    "hs-analytics.net",
+    "adnxs.com",
+)
+
+def _is_blocked_host(url: str) -> bool:
+    """Check whether url points at one of the blocked tracker domains."""
+    host = urlsplit(url).hostname or ""
+    return any(host == domain or host.endswith("." + domain) for domain in _BLOCKED_DOMAINS)
+
+async def _block_resources(route: Route):
+    """Abort requests for blocked resource types and trackers, let the rest through."""
+    request = route.request
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES or _is_blocked_host(request.url):
+        await route.abort()
+    else:
+        await route.continue_()
+
+def debug_print(class_name: str, function_name: str, detail: str, *args: Any):
+    """
+    Log debug messages in the standard format.
+
+    detail is a %-format string; args are only formatted if DEBUG is enabled.
+    """
+    logger.debug("[industry_crawler][%s][%s] " + detail, class_name, function_name, *args)
+
+# Elements removed from a page before its content is extracted
+_NON_CONTENT_SELECTOR = "script, style, iframe, nav, footer, header, aside, noscript, svg"
+
+# Selectors for the main content area, tried in priority order
+_MAIN_CONTENT_SELECTORS = ("main", "article", "div[role='main']", ".content", "#content", ".post-content")
+
+# Runs of blank lines collapsed in extracted text
+_BLANK_LINES = re.compile(r"\n{3,}")
+
+def _extract_content(html: str, markdown: bool = False) -> Tuple[Optional[str], str, int]:
+    """
+    Extract the title and main content of a page.
+
+    Args:
+        html: Page HTML
+        markdown: Convert the main content to markdown instead of plain text
+
+    Returns the title, the main content, and the length of the main
+    content's visible text.
+    """
+    # Parse HTML and extract content
+    tree = HTMLParser(html)
+
+    # Extract title if available
+    title_node = tree.css_first("title")
+    title = title_node.text() if title_node is not None else None
+
+    # Remove non-content elements in one query. Matches come in document
+    # order, so walking them backwards removes nested matches before the
+    # elements containing them
+    for element in reversed(tree.css(_NON_CONTENT_SELECTOR)):
+        element.decompose()
+
+    # Extract main content area if possible
+    main_content = None
+    for selector in _MAIN_CONTENT_SELECTORS:
+        main_content = tree.css_first(selector)
+        if main_content is not None:
+            break
+    if main_content is not None:
+        node = main_content
+    else:
+        node = tree.body if tree.body is not None else tree.root
+
+    if markdown:
+        return title, md(node.html), len(node.text(strip=True))
+
+    # Plain text is all the pain point extraction needs, and is much
+    # cheaper to produce than markdown
+    content = _BLANK_LINES.sub("\n\n", node.text(separator="\n", strip=True))
+    return title, content, len(content)
+
+class _LazyBrowser:
+    """Launches the shared Chromium browser and context on first use."""
+
+    def __init__(self, playwright: Playwright):
+        self._playwright = playwright
+        self._browser: Optional[Browser] = None
+        self._context: Optional[BrowserContext] = None
+        self._lock = asyncio.Lock()
+
+    async def context(self) -> BrowserContext:
+        """Get the shared browser context, launching the browser if needed."""
+        async with self._lock:
+            if self._context is None:
+                # Use chromium with stealth mode; one context shares cookies
+                # and connections between all pages
+                self._browser = await self._playwright.chromium.launch(headless=True)
+                self._context = await self._browser.new_context(
+                    viewport={'width': 1920, 'height': 1080},
+                    user_agent=_USER_AGENT,
+                    extra_http_headers=_HEADERS
+                )
+                await self._context.route("**/*", _block_resources)
+            return self._context
+
+    async def close(self):
+        """Close the browser if it was launched."""
+        if self._browser is not None:
+            await self._browser.close()
+
+class _CrawlSession:
+    """
+    The process pool, Playwright and HTTP client one or more crawls share.
+    The browser itself is only launched when a page first needs it.
+    """
+
+    def __init__(self):
+        self.executor: Optional[ProcessPoolExecutor] = None
+        self.playwright: Optional[Playwright] = None
+        self.browser: Optional[_LazyBrowser] = None
+        self.http: Optional[httpx.AsyncClient] = None
+
+    async def open(self) -> "_CrawlSession":
+        """Open the session resources, closing them again if any fails."""
+        try:
+            self.executor = ProcessPoolExecutor(mp_context=multiprocessing.get_context(_MP_CONTEXT))
+            self.playwright = await async_playwright().start()
+            self.browser = _LazyBrowser(self.playwright)
+            self.http = httpx.AsyncClient(
+                headers=_HTTP_HEADERS,
+                timeout=15,
+                follow_redirects=True
+            )
+        except BaseException:
+            await self.close()
+            raise
+        return self
+
+    async def close(self):
+        """Close every opened resource, even if closing an earlier one fails."""
+        try:
+            if self.http is not None:
+                await self.http.aclose()
+        finally:
+            try:
+                if self.browser is not None:
+                    await self.browser.close()
+            finally:
+                try:
+                    if self.playwright is not None:
+                        await self.playwright.stop()
+                finally:
+                    executor = self.executor
+                    self.executor = self.playwright = self.browser = self.http = None
+                    if executor is not None:
+                        # Wait for the worker processes to exit in a thread,
+                        # not on the event loop
+                        await asyncio.get_running_loop().run_in_executor(None, executor.shutdown)
+
+class _CrawlPipeline:
+    """
+    One crawl run as three stages connected by queues: fetchers
+    (url_q -> html_q), parsers running _extract_content in worker processes
+    (html_q -> parsed_q) and a single database writer that stores parsed
+    entries in batches.
+    """
+    # Fetched, not yet parsed pages buffered between the fetch and parse stages
+    HTML_QUEUE_SIZE = 32
+
+    # The writer stores a batch once it has this many entries...
+    BATCH_SIZE = 16
+    # ...or this many seconds after the first entry of the batch arrived
+    BATCH_INTERVAL = 1.0
+
+    def __init__(self, crawler: "IndustryCrawler", http: httpx.AsyncClient,
+                 browser: _LazyBrowser, executor: ProcessPoolExecutor,
+                 tags: Optional[List[str]]):
+        """
+        Set up the queues for one crawl.
+
+        Args:
+            crawler: Crawler providing the fetch methods and the database
+            http: Shared HTTP client for the static fetch
+            browser: Shared browser, used when the static fetch is not enough
+            executor: Process pool the HTML is parsed in
+            tags: Optional list of tags to categorize the data
+        """
+        self.crawler = crawler
+        self.http = http
+        self.browser = browser
+        self.executor = executor
+        self.tags = tags
+        # (index, url, use_browser)
+        self.url_q: asyncio.Queue = asyncio.Queue()
+        # (index, url, html, from_browser)
+        self.html_q: asyncio.Queue = asyncio.Queue(maxsize=self.HTML_QUEUE_SIZE)
+        # (index, entry, pain point cache key or None), or None once every
+        # URL has been handled
+        self.parsed_q: asyncio.Queue = asyncio.Queue()
+        self.entries: List[Optional[Dict[str, Any]]] = []
+        self._pending = 0
+        self._all_parsed = asyncio.Event()
+
+    async def run(self, urls: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Crawl urls and return their entries in the same order, with None for
+        URLs that could not be crawled.
+        """
+        self.entries = [None] * len(urls)
+        for index, url in enumerate(urls):
+            self.url_q.put_nowait((index, url, False))
+        self._pending = len(urls)
+        if not self._pending:
+            return self.entries
+
+        workers = [asyncio.create_task(self._fetch_worker())
+                   for _ in range(self.crawler.MAX_CONCURRENT_PAGES)]
+        workers += [asyncio.create_task(self._parse_worker())
+                    for _ in range(os.cpu_count() or 1)]
+        writer = asyncio.create_task(self._write_worker())
+        try:
+            await self._all_parsed.wait()
+            await self.parsed_q.put(None)
+            await writer
+        finally:
+            writer.cancel()
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(writer, *workers, return_exceptions=True)
+        return self.entries
+
+    def _finish_one(self):
+        """Mark one URL as parsed or failed."""
+        self._pending -= 1
+        if not self._pending:
+            self._all_parsed.set()
+
+    async def _fetch_worker(self):
+        """Fetch queued URLs and pass their HTML on to the parsers."""
+        while True:
+            index, url, use_browser = await self.url_q.get()
+            try:
+                if use_browser:
+                    # Static fetch failed or the page is rendered by JavaScript
+                    debug_print("IndustryCrawler", "crawl_industry_data",
+                              "Falling back to browser for %s", url)
+                    html = await self.crawler._get_page_content(url, await self.browser.context())
+                else:
+                    debug_print("IndustryCrawler", "crawl_industry_data", "Crawling %s", url)
+                    html = await self.crawler._fetch_http(url, self.http)
+
+                if html:
+                    await self.html_q.put((index, url, html, use_browser))
+                elif use_browser:
+                    self._finish_one()
+                else:
+                    self.url_q.put_nowait((index, url, True))
+
+            except Exception as e:
+                debug_print("IndustryCrawler", "crawl_industry_data",
+                          "Error crawling %s: %s", url, e)
+                self._finish_one()
+
+    async def _parse_worker(self):
+        """Extract the content of fetched pages in the process pool."""
+        loop = asyncio.get_running_loop()
+        while True:
+            index, url, html, from_browser = await self.html_q.get()
+            try:
+                title, content, text_length = await loop.run_in_executor(
+                    self.executor, _extract_content, html, self.crawler.markdown
+                )
+                if not from_browser and text_length < self.crawler.MIN_TEXT_LENGTH:
+                    self.url_q.put_nowait((index, url, True))
+                    continue
+
+                pain_points, cache_key = await self.crawler._get_pain_points(content)
+
+                debug_print("IndustryCrawler", "crawl_industry_data",
+                          "Successfully crawled data from %s", url)
+                self.parsed_q.put_nowait((index, {
+                    "source": url,
+                    "title": title,
+                    "content": content,
+                    "pain_points": pain_points,
+                    "tags": self.tags,
+                    "crawled_at": datetime.now().isoformat()
+                }, cache_key))
+
+            except Exception as e:
+                debug_print("IndustryCrawler", "crawl_industry_data",
+                          "Error crawling %s: %s", url, e)
+            self._finish_one()
+
+    async def _write_worker(self):
+        """Store parsed entries in batches of BATCH_SIZE or every BATCH_INTERVAL."""
+        loop = asyncio.get_running_loop()
+        batch: List[Tuple[int, Dict[str, Any], Optional[str]]] = []
+        deadline = None
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - loop.time())
+            try:
+                item = await asyncio.wait_for(self.parsed_q.get(), timeout)
+            except asyncio.TimeoutError:
+                self._store(batch)
+                batch, deadline = [], None
+                continue
+
+            if item is None:
+                self._store(batch)
+                return
+
+            batch.append(item)
+            if deadline is None:
+                deadline = loop.time() + self.BATCH_INTERVAL
+            if len(batch) >= self.BATCH_SIZE:
+                self._store(batch)
+                batch, deadline = [], None
+
+    def _store(self, batch: List[Tuple[int, Dict[str, Any], Optional[str]]]):
+        """
+        Store a batch of new entries with metadata, and the pain points newly
+        extracted for them, in one transaction.
+
+        A batch that fails to store is logged and its URLs left without an
+        entry, so the writer keeps storing the batches after it.
+        """
+        if not batch:
+            return
+        db = self.crawler.db
+        try:
+            with db.transaction():
+                entry_ids = db.add_industry_data_bulk([entry for _, entry, _ in batch])
+                db.cache_pain_points_bulk([
+                    (cache_key, entry["pain_points"])
+                    for _, entry, cache_key in batch
+                    if cache_key is not None
+                ])
+        except Exception as e:
+            debug_print("IndustryCrawler", "crawl_industry_data",
+                      "Error storing %s entries: %s", len(batch), e)
+            return
+        for (index, entry, _), entry_id in zip(batch, entry_ids):
+            entry["id"] = entry_id
+            self.entries[index] = entry
+        debug_print("IndustryCrawler", "crawl_industry_data",
+                  "Stored %s new entries", len(batch))
 
 class IndustryCrawler:
-    def __init__(self, client_id: str):
-        """Initialize industry crawler for a specific client."""
+    def __init__(self, client_id: str, markdown: bool = False):
+        """
+        Initialize industry crawler for a specific client.
+
+        Args:
+            client_id: Identifier of the client the data is stored for
+            markdown: Store page content as markdown instead of plain text
+        """
         self.client_id = client_id
+        self.markdown = markdown
         self.db = DatabaseManager(client_id)
-        debug_print("IndustryCrawler", "__init__", f"Initialized for client {client_id}")
+        # URLs this crawler has stored or served from the cache
+        self._seen: Set[str] = set()
+        # URLs a running crawl_industry_data call is handling
+        self._in_flight: Set[str] = set()
+        # Crawl session shared between calls, opened by __aenter__
+        self._session: Optional[_CrawlSession] = None
+        debug_print("IndustryCrawler", "__init__", "Initialized for client %s", client_id)
 
-    async def _get_page_content(self, url: str) -> Optional[str]:
+    async def __aenter__(self) -> "IndustryCrawler":
         """
-        Get page content using Playwright with anti-detection measures.
+        Open the process pool, Playwright and the HTTP client once, so every
+        crawl_industry_data call in the session reuses them. The browser
+        itself is still only launched when a page first needs it.
         """
+        if self._session is not None:
+            raise RuntimeError("IndustryCrawler session is already open")
+        self._session = _CrawlSession()
         try:
-            async with async_playwright() as p:
-                # Use chromium with stealth mode
-                browser = await p.chromium.launch(headless=True)
-                context = await browser.new_context(
-                    viewport={'width': 1920, 'height': 1080},
-                    user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-                )
+            await self._session.open()
+        except BaseException:
+            self._session = None
+            raise
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        """Close the resources opened by __aenter__."""
+        session, self._session = self._session, None
+        await session.close()
+
+    # Maximum number of pages fetched at the same time
+    MAX_CONCURRENT_PAGES = 8
+
+    # Pages whose main content has less visible text than this over plain
+    # HTTP are assumed to need JavaScript and are fetched with the browser
+    MIN_TEXT_LENGTH = 500
+
+    # Pages crawled more recently than this are served from the database
+    CACHE_TTL = timedelta(hours=24)
+
+    def _cache_get(self, url: str) -> Optional[Dict[str, Any]]:
+        """Get the stored entry for url if it was crawled within CACHE_TTL."""
+        crawled_after = (datetime.now() - self.CACHE_TTL).isoformat()
+        return self.db.get_industry_data_by_source(url, crawled_after=crawled_after)
+
+    # Identifies the pain point extractor; part of the cache key so changing
+    # the model or prompt invalidates previously cached results. None while
+    # _extract_pain_points is a placeholder, so its output is not cached
+    PAIN_POINTS_EXTRACTOR: Optional[str] = None
+
+    # Cached pain points older than this are ignored and pruned
+    PAIN_POINTS_CACHE_TTL = timedelta(days=30)
+
+    async def _extract_pain_points(self, content: str) -> str:
+        """Extract pain points from page content."""
+        # TODO: Use LLM to extract pain points from content
+        return "TODO: Extract pain points using LLM"
+
+    async def _get_pain_points(self, content: str) -> Tuple[str, Optional[str]]:
+        """
+        Get the pain points for page content, reusing the cached result when
+        the same content was analysed before.
+
+        Returns the pain points and the content hash to cache them under, or
+        None if there is nothing new to cache. The caller stores the cache
+        row together with the entry, see _CrawlPipeline._store.
+        """
+        if self.PAIN_POINTS_EXTRACTOR is None:
+            return await self._extract_pain_points(content), None
 
-                # Enable JavaScript and wait for network idle
-                page = await context.new_page()
-                await page.set_extra_http_headers({
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                    'Accept-Language': 'en-US,en;q=0.5',
-                    'Sec-Fetch-Dest': 'document',
-                    'Sec-Fetch-Mode': 'navigate',
-                    'Sec-Fetch-Site': 'none',
-                    'Sec-Fetch-User': '?1',
-                    'Upgrade-Insecure-Requests': '1'
-                })
-
-                # Navigate and wait for content to load
-                response = await page.goto(url, wait_until='networkidle')
-                if not response or not response.ok:
-                    raise Exception(f"Failed to fetch {url}: {response.status if response else 'No response'}")
-
-                # Wait for main content to load
-                await page.wait_for_load_state('networkidle')
-                
-                # Get the page content
-                content = await page.content()
-                
-                await browser.close()
-                return content
+        key = f"{self.PAIN_POINTS_EXTRACTOR}\0{content}".encode()
+        content_hash = hashlib.sha256(key).hexdigest()
+        pain_points = self.db.get_cached_pain_points(content_hash, self.PAIN_POINTS_CACHE_TTL)
+        if pain_points is not None:
+            return pain_points, None
+        return await self._extract_pain_points(content), content_hash
+
+    async def _fetch_http(self, url: str, http: httpx.AsyncClient) -> Optional[str]:
+        """
+        Get page HTML with a plain HTTP request.
+
+        Returns None unless the response is a 200 HTML document.
+        """
+        try:
+            response = await http.get(url)
+            if response.status_code != 200:
+                debug_print("IndustryCrawler", "_fetch_http",
+                          "Got status %s for %s", response.status_code, url)
+                return None
+            if 'html' not in response.headers.get('content-type', ''):
+                return None
+            return response.text
+
+        except httpx.HTTPError as e:
+            debug_print("IndustryCrawler", "_fetch_http", "Error fetching %s: %s", url, e)
+            return None
+
+    async def _get_page_content(self, url: str, context: BrowserContext) -> Optional[str]:
+        """
+        Get page content using a page of the shared Playwright browser context.
+        """
+        page = None
+        try:
+            # Open a page in the shared context (JavaScript enabled)
+            page = await context.new_page()
+
+            # Navigate and wait for content to load
+            response = await page.goto(url, wait_until='domcontentloaded', timeout=20000)
+            if not response or not response.ok:
+                raise Exception(f"Failed to fetch {url}: {response.status if response else 'No response'}")
+
+            # Wait for main content to render, but take the page as it is if
+            # it never shows up
+            try:
+                await page.wait_for_selector('main, article', timeout=5000)
+            except PlaywrightTimeoutError:
+                debug_print("IndustryCrawler", "_get_page_content",
+                          "No main content element on %s", url)
+
+            # Get the page content
+            return await page.content()
 
         except Exception as e:
-            debug_print("IndustryCrawler", "_get_page_content", f"Error fetching {url}: {str(e)}")
+            debug_print("IndustryCrawler", "_get_page_content", "Error fetching %s: %s", url, e)
             return None
+        finally:
+            if page is not None:
+                await page.close()
 
     async def crawl_industry_data(self, urls: List[str], tags: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """
-        Crawl multiple URLs for industry data using Playwright.
-        
+        Crawl multiple URLs for industry data.
+
+        Pages are fetched concurrently (up to MAX_CONCURRENT_PAGES at a time)
+        over plain HTTP first; Playwright is only launched for pages that
+        need JavaScript. Parsing runs in worker processes and new entries
+        are stored in batches, see _CrawlPipeline. Results keep the order
+        of urls; URLs this crawler has already crawled, or is crawling, are
+        skipped. URLs that fail are retried by later calls.
+
+        Use the crawler as an async context manager to share the browser and
+        connections between calls; otherwise they are opened for this call.
+
         Args:
             urls: List of URLs to crawl
             tags: Optional list of tags to categorize the data (e.g., ['sales_trends', 'statistics'])
         """
-        results = []
-        for url in urls:
-            try:
-                debug_print("IndustryCrawler", "crawl_industry_data", f"Crawling {url}")
-                
-                # Get page content using Playwright
-                content = await self._get_page_content(url)
-                if not content:
-                    continue
-                
-                # Parse HTML and extract content
-                soup = BeautifulSoup(content, 'html.parser')
-                
-                # Extract title if available
-                title = soup.title.string if soup.title else None
-                
-                # Remove non-content elements
-                for element in soup(["script", "style", "iframe", "nav", "footer", "header", "aside"]):
-                    element.decompose()
-                
-                # Extract main content area if possible
-                main_content = None
-                for tag in ["main", "article", "div[role='main']", ".content", "#content", ".post-content"]:
-                    main_content = soup.select_one(tag)
-                    if main_content:
-                        break
-                
-                # Convert to markdown
-                content = md(str(main_content if main_content else soup))
-                
-                # TODO: Use LLM to extract pain points from content
-                pain_points = "TODO: Extract pain points using LLM"
-                
-                # Store in database with metadata
-                entry_id = self.db.add_industry_data(
-                    source=url,
-                    content=content,
-                    pain_points=pain_points,
-                    title=title,
-                    tags=tags,
-                    crawled_at=datetime.now().isoformat()
-                )
-                
-                results.append({
-                    "id": entry_id,
-                    "source": url,
-                    "title": title,
-                    "content": content[:200] + "...",  # Truncated for logging
-                    "pain_points": pain_points,
-                    "tags": tags
-                })
-                
-                debug_print("IndustryCrawler", "crawl_industry_data", 
-                          f"Successfully crawled and stored data from {url}")
-                
-            except Exception as e:
-                debug_print("IndustryCrawler", "crawl_industry_data", 
-                          f"Error crawling {url}: {str(e)}")
-        
-        return results
+        # Skip URLs this crawler already crawled or is crawling, and repeats
+        # within urls
+        new_urls = [url for url in dict.fromkeys(urls)
+                    if url not in self._seen and url not in self._in_flight]
+        if len(new_urls) < len(urls):
+            debug_print("IndustryCrawler", "crawl_industry_data",
+                      "Skipping %s already crawled URLs", len(urls) - len(new_urls))
+        if not new_urls:
+            return []
+        if self.PAIN_POINTS_EXTRACTOR is not None:
+            self.db.prune_pain_point_cache(self.PAIN_POINTS_CACHE_TTL)
+        self._in_flight.update(new_urls)
+
+        # Not inside `async with crawler`: use a private session for this
+        # call, so closing it cannot affect other calls
+        private = self._session is None
+        session = None
+        try:
+            # Serve recently crawled URLs from the database, and only open a
+            # session if some URL still has to be fetched
+            entries: List[Optional[Dict[str, Any]]] = []
+            uncached = []
+            for url in new_urls:
+                entry = self._cache_get(url)
+                if entry is not None:
+                    debug_print("IndustryCrawler", "crawl_industry_data", "Using cached data for %s", url)
+                else:
+                    uncached.append(url)
+                entries.append(entry)
+            if uncached:
+                session = await _CrawlSession().open() if private else self._session
+                pipeline = _CrawlPipeline(self, session.http, session.browser,
+                                          session.executor, tags)
+                crawled = iter(await pipeline.run(uncached))
+                entries = [entry if entry is not None else next(crawled) for entry in entries]
+            # Failed URLs stay unseen so a later call retries them
+            self._seen.update(entry["source"] for entry in entries if entry is not None)
+        finally:
+            self._in_flight.difference_update(new_urls)
+            if private and session is not None:
+                await session.close()
+
+        return [
+            {
+                "id": entry["id"],
+                "source": entry["source"],
+                "title": entry["title"],
+                "content": entry["content"][:200] + "...",  # Truncated for logging
+                "pain_points": entry["pain_points"],
+                "tags": entry["tags"]
+            }
+            for entry in entries
+            if entry is not None
+        ]
 
     def get_recent_data(self, limit: int = 10, tags: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """